@@ -1,10 +1,14 @@
 """Standalone Slack Bot client for posting messages to channels or DMs."""
 
+import json
 import logging
 import os
+import random
+import time
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 __version__ = "0.1.0"
 
@@ -15,6 +19,42 @@ ENV_BOT_TOKEN = "SLACK_BOT_TOKEN"
 ENV_USER_ID = "SLACK_USER_ID"
 ENV_CHANNEL = "SLACK_CHANNEL"
 
+# Retry policy for transient failures: used for Slack API calls here and exported
+# (with backoff_delay) so callers can apply the same policy to their own retries
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
+
+# Slack allows roughly one chat.postMessage per second per channel
+POST_MIN_INTERVAL = 1.0
+
+# Slack API errors that will fail the same way on every retry (bad config or credentials)
+PERMANENT_ERRORS = frozenset({
+    "channel_not_found",
+    "not_in_channel",
+    "is_archived",
+    "invalid_auth",
+    "not_authed",
+    "account_inactive",
+    "token_revoked",
+    "missing_scope",
+    "user_not_found",
+    "dm_user_id_missing",
+})
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with up to 50% jitter, capped at BACKOFF_CAP seconds. Shared with callers' own retries."""
+    return min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) * (1 + random.random() * 0.5)
+
+
+def _retry_after(resp: requests.Response) -> Optional[float]:
+    """Seconds from a numeric Retry-After header, clamped to [0, BACKOFF_CAP]; None if absent or not a number."""
+    try:
+        return min(BACKOFF_CAP, max(0.0, float(resp.headers["Retry-After"])))
+    except (KeyError, ValueError):
+        return None
+
 
 class SlackBotClient:
     """
@@ -37,6 +77,9 @@ class SlackBotClient:
         client.post("Direct message")
     """
 
+    # DM channel IDs resolved via conversations.open, shared across instances
+    _DM_CACHE: dict[tuple[str, str], str] = {}
+
     def __init__(
         self,
         bot_token: str,
@@ -53,6 +96,17 @@ class SlackBotClient:
         self.dm_user_id = dm_user_id
         self.channel = channel
         self._dm_channel_id: Optional[str] = None
+        self._last_post_ts: Optional[float] = None
+        # Slack error code (or exception text) from the last failed call; None after a success
+        self.last_error: Optional[str] = None
+
+        # Reuse one keep-alive connection to slack.com across API calls
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Authorization": f"Bearer {bot_token}",
+            "Content-Type": "application/json",
+        })
+        self._session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
 
     @classmethod
     def from_env(
@@ -66,12 +120,21 @@ class SlackBotClient:
 
         Reads SLACK_BOT_TOKEN, SLACK_USER_ID, SLACK_CHANNEL (optional).
         Pass explicit args to override env vars.
+        In DM mode the DM channel is opened here so the first post skips that round-trip.
         """
-        return cls(
+        client = cls(
             bot_token=bot_token or os.environ[ENV_BOT_TOKEN],
             dm_user_id=dm_user_id or os.environ.get(ENV_USER_ID),
             channel=channel or os.environ.get(ENV_CHANNEL),
         )
+        if not client.channel and client.dm_user_id:
+            client._get_dm_channel()
+        return client
+
+    @property
+    def last_error_permanent(self) -> bool:
+        """True if the last failure is a configuration/auth error that retrying won't fix."""
+        return self.last_error in PERMANENT_ERRORS
 
     def post(
         self,
@@ -86,7 +149,7 @@ class SlackBotClient:
             ping_user_id: If set, prepends <@user_id> to ping the user. Defaults to dm_user_id when channel is set.
 
         Returns:
-            True if sent successfully, False otherwise.
+            True if sent successfully, False otherwise (see last_error / last_error_permanent).
         """
         ping = ping_user_id or (self.dm_user_id if self.channel else None)
         if ping:
@@ -97,24 +160,63 @@ class SlackBotClient:
             if not channel_id:
                 return False
 
-            resp = requests.post(
-                "https://slack.com/api/chat.postMessage",
-                headers={
-                    "Authorization": f"Bearer {self.bot_token}",
-                    "Content-Type": "application/json",
-                },
-                json={"channel": channel_id, "text": text},
-                timeout=10,
-            )
-            data = resp.json()
+            # Pace posts proactively rather than waiting to be told off with a 429
+            if self._last_post_ts is not None:
+                wait = POST_MIN_INTERVAL - (time.monotonic() - self._last_post_ts)
+                if wait > 0:
+                    time.sleep(wait)
+
+            data = self._api_call("chat.postMessage", {"channel": channel_id, "text": text}, idempotent=False)
             if not data.get("ok"):
-                logger.error("Slack chat.postMessage failed: %s", data.get("error", "unknown"))
+                self.last_error = data.get("error", "unknown")
+                logger.error("Slack chat.postMessage failed: %s", self.last_error)
                 return False
+            self._last_post_ts = time.monotonic()
+            self.last_error = None
             return True
         except Exception as e:
+            self.last_error = str(e)
             logger.error("Slack post failed: %s", e)
             return False
 
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self._session.close()
+
+    def _api_call(self, method: str, payload: dict, idempotent: bool = True) -> dict:
+        """
+        POST to a Slack Web API method and return the decoded JSON body.
+
+        Connection errors and 429 responses are retried with exponential backoff (honoring
+        Retry-After, capped at BACKOFF_CAP). Timeouts and 5xx are retried only when idempotent,
+        since the request may already have taken effect (e.g. a duplicate chat.postMessage).
+        API-level errors (ok=False, e.g. channel_not_found) are returned as-is for the caller to handle.
+        """
+        url = f"https://slack.com/api/{method}"
+        retry_exc = (requests.ConnectionError, requests.Timeout) if idempotent else requests.ConnectionError
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                resp = self._session.post(url, json=payload, timeout=10)
+            except retry_exc as e:
+                if attempt == MAX_RETRIES:
+                    raise
+                delay = backoff_delay(attempt)
+                logger.warning("Slack %s failed (%s), retrying in %.1fs", method, e, delay)
+                time.sleep(delay)
+                continue
+
+            retryable = resp.status_code == 429 or (idempotent and resp.status_code >= 500)
+            if attempt < MAX_RETRIES and retryable:
+                delay = _retry_after(resp) if resp.status_code == 429 else None
+                if delay is None:
+                    delay = backoff_delay(attempt)
+                logger.warning("Slack %s returned HTTP %d, retrying in %.1fs", method, resp.status_code, delay)
+                time.sleep(delay)
+                continue
+
+            # Slack always answers in UTF-8 JSON, so skip requests' charset detection
+            return json.loads(resp.content)
+
     def _get_channel(self) -> Optional[str]:
         """Return channel ID or name for posting."""
         if self.channel:
@@ -124,29 +226,30 @@ class SlackBotClient:
     def _get_dm_channel(self) -> Optional[str]:
         """Open or return cached DM channel ID."""
         if not self.dm_user_id:
+            self.last_error = "dm_user_id_missing"
             logger.error("dm_user_id required for DM mode")
             return None
 
         if self._dm_channel_id:
             return self._dm_channel_id
 
+        cache_key = (self.bot_token, self.dm_user_id)
+        cached = self._DM_CACHE.get(cache_key)
+        if cached:
+            self._dm_channel_id = cached
+            return cached
+
         try:
-            resp = requests.post(
-                "https://slack.com/api/conversations.open",
-                headers={
-                    "Authorization": f"Bearer {self.bot_token}",
-                    "Content-Type": "application/json",
-                },
-                json={"users": [self.dm_user_id]},
-                timeout=10,
-            )
-            data = resp.json()
+            data = self._api_call("conversations.open", {"users": [self.dm_user_id]})
             if not data.get("ok"):
-                logger.error("Slack conversations.open failed: %s", data.get("error", "unknown"))
+                self.last_error = data.get("error", "unknown")
+                logger.error("Slack conversations.open failed: %s", self.last_error)
                 return None
 
             self._dm_channel_id = data["channel"]["id"]
+            self._DM_CACHE[cache_key] = self._dm_channel_id
             return self._dm_channel_id
         except Exception as e:
+            self.last_error = str(e)
             logger.error("Slack conversations.open failed: %s", e)
             return None
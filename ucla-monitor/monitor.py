@@ -4,19 +4,31 @@ UCLA Enrollment Monitor - Refreshes MyUCLA enrollment page and posts course avai
 """
 
 import argparse
+import functools
 import logging
 import os
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
 from pathlib import Path
 
+import requests
+
 try:
     import winsound
 except ImportError:
     winsound = None
 
 from selenium import webdriver
+from selenium.common.exceptions import (
+    JavascriptException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -33,59 +45,69 @@ try:
 except ImportError:
     pass
 
-from slack_notifier import SlackBotClient
+from slack_notifier import MAX_RETRIES, SlackBotClient, backoff_delay
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
 UCLA_ENROLLMENT_URL = "https://be.my.ucla.edu/ClassPlanner/ClassPlan.aspx"
 DEFAULT_INTERVAL = 15
+LOGIN_TIMEOUT = 600  # seconds to wait for login to be detected
 
 # (display_name, class_code) — class code appears on line 2 as "[code] - [description]"
 COURSES = [
     ("English 4w", "4w"),
 ]
 
+_CLASS_HDR_RE = re.compile(r"Class \d+:", re.IGNORECASE)
+_OPEN_RE = re.compile(r"open:\s*(\d+)\s+of\s+\d+\s*left")
+_WAITLIST_RE = re.compile(r"waitlist[:\s]*(\d+)")
+
+_WS_RE = re.compile(r"\s+")
+
+_ROW_PREFIXES = ("lec ", "lab ")
+_SECTION_PREFIXES = ("lec ", "lab ", "dis ")
+_CLOSED_KEYS = ("closed", "class full")
+
 
-def _get_class_blocks(page_text: str) -> list[str]:
-    """Split page by 'Class N:' headers. Each block = line 1 + line 2 + content until next Class N:."""
-    parts = re.split(r"(Class \d+:\s*)", page_text, flags=re.IGNORECASE)
-    blocks = []
-    for i in range(1, len(parts), 2):
-        header = parts[i]
-        content = parts[i + 1] if i + 1 < len(parts) else ""
-        blocks.append((header + content).strip())
-    return blocks
+@functools.lru_cache(maxsize=32)
+def _code_match_re(class_code: str) -> re.Pattern:
+    """Compiled pattern for line 2 "[class_code] - [description]", cached per class code."""
+    return re.compile(rf"^\s*{re.escape(class_code)}\s*-\s*")
 
 
-def _block_matches_class_code(block: str, class_code: str) -> bool:
-    """True if line 2 starts with [class_code] - [description]."""
-    lines = block.strip().split("\n")
+def _get_class_blocks(page_text: str) -> list[list[str]]:
+    """Split page by 'Class N:' headers into pre-split line lists. Each block = line 1 + line 2 + content until next Class N:."""
+    starts = [m.start() for m in _CLASS_HDR_RE.finditer(page_text)]
+    ends = starts[1:] + [len(page_text)]
+    return [page_text[start:end].strip().splitlines() for start, end in zip(starts, ends)]
+
+
+def _block_matches_class_code(lines: list[str], pattern: re.Pattern) -> bool:
+    """True if line 2 starts with [class_code] - [description]; pattern comes from _code_match_re."""
     if len(lines) < 2:
         return False
-    line2 = lines[1].strip()
     # Line 2 format: "[class code] - [brief description]"
-    escaped = re.escape(class_code)
-    return bool(re.match(rf"^\s*{escaped}\s*-\s*", line2))
+    return bool(pattern.match(lines[1].lstrip()))
 
 
-def _get_lec_lab_rows(block: str) -> list[str]:
+def _get_lec_lab_rows(lines: list[str]) -> list[str]:
     """From block content (lines 3+), return Lec/Lab rows. Status is on the line after section (Lab 1, Open: 84...)."""
-    lines = block.strip().split("\n")
     rows = []
-    content_lines = lines[2:]  # Skip line 1 (Class N:) and line 2 (code - description)
+    content_lines = [ln.strip() for ln in lines[2:]]  # Skip line 1 (Class N:) and line 2 (code - description)
+    low = [ln.lower() for ln in content_lines]
     i = 0
     while i < len(content_lines):
-        stripped = content_lines[i].strip()
+        stripped = content_lines[i]
         if not stripped:
             i += 1
             continue
-        if stripped.lower().startswith("lec ") or stripped.lower().startswith("lab "):
+        if low[i].startswith(_ROW_PREFIXES):
             # Include this line + next line (status: Open/Closed/Waitlist)
             row_text = stripped
             if i + 1 < len(content_lines):
-                next_line = content_lines[i + 1].strip()
-                if next_line and not (next_line.lower().startswith("lec ") or next_line.lower().startswith("lab ") or next_line.lower().startswith("dis ")):
+                next_line = content_lines[i + 1]
+                if next_line and not low[i + 1].startswith(_SECTION_PREFIXES):
                     row_text += " " + next_line
                     i += 1
             rows.append(row_text)
@@ -102,14 +124,15 @@ def _parse_lec_lab_status(rows: list[str]) -> tuple[str, int | None]:
     waitlist_seats = []
     for row in rows:
         t = row.lower()
-        if "closed" in t or "class full" in t:
+        if any(k in t for k in _CLOSED_KEYS):
             return ("closed", None)
         if "open:" in t:
-            m = re.search(r"open:\s*(\d+)\s+of\s+\d+\s*left", t)
+            m = _OPEN_RE.search(t)
             if m:
                 open_seats.append(int(m.group(1)))
+                continue  # open outranks waitlist, no need to search this row again
         if "waitlist" in t:
-            m = re.search(r"waitlist[:\s]*(\d+)", t)
+            m = _WAITLIST_RE.search(t)
             if m:
                 waitlist_seats.append(int(m.group(1)))
     if open_seats:
@@ -119,22 +142,214 @@ def _parse_lec_lab_status(rows: list[str]) -> tuple[str, int | None]:
     return ("closed", None)
 
 
-def _is_session_expired(driver) -> bool:
-    """Return True if the page looks like a login/session-timeout page."""
-    url = driver.current_url.lower()
-    if "login" in url or "signin" in url or "sso" in url or "logon" in url:
+# WebDriver error messages worth retrying; anything else (dead session, closed window) fails fast
+_TRANSIENT_WEBDRIVER_MSGS = ("timeout", "timed out", "net::err_")
+
+
+def _is_transient(e: Exception) -> bool:
+    """True for errors a retry can plausibly fix: timeouts, network failures, and HTTP 429/5xx."""
+    if isinstance(e, (TimeoutException, requests.ConnectionError, requests.Timeout)):
         return True
+    if isinstance(e, requests.HTTPError):
+        return e.response is not None and (e.response.status_code == 429 or e.response.status_code >= 500)
+    if isinstance(e, WebDriverException):
+        msg = (e.msg or "").lower()
+        return any(k in msg for k in _TRANSIENT_WEBDRIVER_MSGS)
+    return False
+
+
+def _retry(fn, stop: threading.Event):
+    """
+    Call fn(), retrying transient errors with slack_notifier's backoff policy. Re-raises the last error.
+    Backoff sleeps end early once stop is set, so shutdown doesn't wait out the retries.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == MAX_RETRIES or not _is_transient(e):
+                raise
+            delay = backoff_delay(attempt)
+            logger.warning("%s failed (%s), retrying in %.1fs", getattr(fn, "__name__", "call"), e, delay)
+            if stop.wait(delay):
+                raise
+
+
+def _get_page_text(driver) -> str:
+    """
+    Return the rendered body text, computed in the browser via innerText in a single WebDriver call.
+    innerText keeps non-breaking spaces (Selenium's .text didn't), so map them to plain spaces for the parser.
+    """
+    text = driver.execute_script("return document.body ? document.body.innerText : '';") or ""
+    return text.replace("\xa0", " ")
+
+
+def _fetch_page(driver, interval: int, stop: threading.Event) -> tuple[str, str] | None:
+    """Wait one interval, refresh, and return (url, page text). Returns None if stopped or the fetch failed."""
+    if stop.wait(interval):
+        return None
     try:
-        body = driver.find_element(By.TAG_NAME, "body").text.lower()
-        login_signals = ["sign in", "username", "password", "session has expired", "timed out", "log in"]
-        if sum(1 for s in login_signals if s in body) >= 2:
+        _retry(driver.refresh, stop)
+    except Exception as e:
+        logger.warning("Refresh failed: %s", e)
+        return None
+
+    try:
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+    except Exception as e:
+        logger.warning("Wait for page failed: %s", e)
+        return None
+
+    # Read the page once per refresh and share it across all courses
+    try:
+        return driver.current_url, _get_page_text(driver)
+    except Exception as e:
+        logger.warning("Read page text failed: %s", e)
+        return None
+
+
+class _TextExtractor(HTMLParser):
+    """
+    Collect page text, breaking lines at block-level tags (a rough stand-in for innerText).
+    Like innerText, cells of a table row stay on one line, separated by tabs, and non-rendered
+    content is dropped: script/style, <select> option labels, and elements hidden with the
+    hidden attribute or an inline display:none / visibility:hidden style. Elements hidden by
+    CSS classes or stylesheets can't be seen from the markup and are still included.
+    """
+
+    _BLOCK_TAGS = {"br", "p", "div", "tr", "li", "table", "h1", "h2", "h3", "h4", "h5", "h6"}
+    _CELL_TAGS = {"td", "th"}
+    _SKIP_TAGS = {"head", "script", "style", "noscript", "template", "select"}
+    _VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+    # Elements whose end tag may be omitted, and the start tags that implicitly close them
+    _CLOSED_BY_START = {
+        "p": {"p", "div", "table", "ul", "ol", "dl", "pre", "form", "h1", "h2", "h3", "h4", "h5", "h6"},
+        "li": {"li"},
+        "dt": {"dt", "dd"},
+        "dd": {"dt", "dd"},
+        "td": {"td", "th", "tr"},
+        "th": {"td", "th", "tr"},
+        "tr": {"tr"},
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.parts: list[str] = []
+        # Open elements of the hidden subtree being skipped; its root is first, empty when not skipping
+        self._skip_stack: list[str] = []
+
+    @staticmethod
+    def _is_hidden(attrs) -> bool:
+        attrs = dict(attrs)
+        if "hidden" in attrs:
             return True
-    except Exception:
-        pass
-    return False
+        style = (attrs.get("style") or "").replace(" ", "").lower()
+        return "display:none" in style or "visibility:hidden" in style
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._VOID_TAGS:
+            if tag == "br" and not self._skip_stack:
+                self.parts.append("\n")
+            return
+        if self._skip_stack:
+            # Pop elements this tag implicitly closes; if that closes the hidden root, the skip ends here
+            stack = self._skip_stack
+            while stack and tag in self._CLOSED_BY_START.get(stack[-1], ()):
+                stack.pop()
+            if stack:
+                stack.append(tag)
+                return
+        if tag in self._SKIP_TAGS or self._is_hidden(attrs):
+            self._skip_stack = [tag]
+        elif tag in self._BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in self._VOID_TAGS:
+            return
+        if self._skip_stack:
+            stack = self._skip_stack
+            if tag in stack:
+                # Close this element and anything left open inside it
+                del stack[len(stack) - 1 - stack[::-1].index(tag):]
+                return
+            # An end tag from outside the subtree closes the hidden root implicitly
+            self._skip_stack = []
+        if tag in self._BLOCK_TAGS:
+            self.parts.append("\n")
+        elif tag in self._CELL_TAGS:
+            self.parts.append("\t")
+
+    def handle_data(self, data):
+        if not self._skip_stack:
+            # Source newlines/indentation are plain whitespace in HTML; only tags break lines
+            self.parts.append(_WS_RE.sub(" ", data))
+
+
+def _html_to_text(html: str) -> str:
+    """Convert page HTML to one line per block element or table row, whitespace collapsed and blank lines dropped."""
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    lines = (
+        "\t".join(" ".join(cell.split()) for cell in line.split("\t")).strip("\t")
+        for line in "".join(parser.parts).splitlines()
+    )
+    return "\n".join(line for line in lines if line)
+
+
+def _sync_cookies(driver, session: requests.Session) -> None:
+    """Copy the browser's cookies and User-Agent into session so it shares the logged-in MyUCLA session."""
+    session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+    for c in driver.get_cookies():
+        session.cookies.set(c["name"], c["value"], domain=c.get("domain"), path=c.get("path", "/"))
+
+
+def _fetch_page_http(session: requests.Session, interval: int, stop: threading.Event) -> tuple[str, str] | None:
+    """Like _fetch_page, but GETs the enrollment page over HTTP with the browser's cookies instead of refreshing Chrome."""
+    if stop.wait(interval):
+        return None
+
+    def get_enrollment_page() -> requests.Response:
+        resp = session.get(UCLA_ENROLLMENT_URL, timeout=10)
+        resp.raise_for_status()
+        return resp
+
+    try:
+        resp = _retry(get_enrollment_page, stop)
+    except Exception as e:
+        logger.warning("HTTP fetch failed: %s", e)
+        return None
+    return resp.url, _html_to_text(resp.text)
+
+
+def _is_session_expired(url: str, page_text: str) -> bool:
+    """Return True if the page looks like a login/session-timeout page."""
+    url = url.lower()
+    if "login" in url or "signin" in url or "sso" in url or "logon" in url:
+        return True
+    body = page_text.lower()
+    login_signals = ["sign in", "username", "password", "session has expired", "timed out", "log in"]
+    return sum(1 for s in login_signals if s in body) >= 2
+
+
+def _wait_for_login(driver, interactive: bool, prompt: str) -> None:
+    """Block until the enrollment page is visible: on Enter in interactive mode, else when the Class Plan loads."""
+    if interactive:
+        input(prompt)
+        return
+    logger.info("Waiting up to %ds for login to complete...", LOGIN_TIMEOUT)
+    # Same header test the parser uses, so login is detected exactly when the page becomes parseable
+    # Ignore only errors a page transition can cause; a closed window or dead session must propagate
+    WebDriverWait(driver, LOGIN_TIMEOUT, ignored_exceptions=(JavascriptException, StaleElementReferenceException)).until(EC.all_of(
+        EC.url_contains("ClassPlan.aspx"),
+        lambda d: _CLASS_HDR_RE.search(_get_page_text(d)),
+    ))
 
 
-def _wait_for_relogin(driver) -> None:
+def _wait_for_relogin(driver, interactive: bool) -> None:
     """Navigate back to enrollment URL and block until user re-logs in."""
     logger.warning("Session expired — navigating back to enrollment page. Please log back in.")
     if winsound:
@@ -143,25 +358,36 @@ def _wait_for_relogin(driver) -> None:
         except Exception:
             pass
     driver.get(UCLA_ENROLLMENT_URL)
-    input("Press Enter after you've logged back in and the enrollment page is visible...")
+    # Keep waiting rather than navigating again, which would pull a user mid-SSO off the page
+    while True:
+        try:
+            _wait_for_login(driver, interactive, "Press Enter after you've logged back in and the enrollment page is visible...")
+            break
+        except TimeoutException:
+            logger.warning("Re-login not detected within %ds, still waiting", LOGIN_TIMEOUT)
     logger.info("Resuming monitor...")
 
 
-def get_course_availability(driver, label: str, class_code: str) -> tuple[str, str]:
+def get_course_availability(page_text: str, label: str, class_code: str) -> str:
     """
     Find block(s) where line 2 starts with [class_code] - [description].
     Only look at Lec/Lab rows (ignore Dis). Closed has priority. Then Open (seats), then Waitlist (seats).
     """
     try:
-        page_text = driver.find_element(By.TAG_NAME, "body").text
         if class_code not in page_text:
-            return f"[{label} - NOT FOUND]", ""
+            return f"[{label} - NOT FOUND]"
 
         blocks = _get_class_blocks(page_text)
-        matching_blocks = [b for b in blocks if _block_matches_class_code(b, class_code)]
+        # Cheap substring pre-filter on line 2 before running the regex
+        candidates = [b for b in blocks if len(b) > 1 and class_code in b[1]]
+        pattern = _code_match_re(class_code)
+        matching_blocks = [b for b in candidates if _block_matches_class_code(b, pattern)]
 
         if not matching_blocks:
-            return f"[{label} - NOT FOUND]", ""
+            return f"[{label} - NOT FOUND]"
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s block:\n%s", label, "\n".join(matching_blocks[0])[:600])
 
         # Collect Lec/Lab rows from all matching blocks
         all_lec_lab_rows = []
@@ -169,20 +395,20 @@ def get_course_availability(driver, label: str, class_code: str) -> tuple[str, s
             all_lec_lab_rows.extend(_get_lec_lab_rows(block))
 
         if not all_lec_lab_rows:
-            return f"[{label} - NOT FOUND]", matching_blocks[0][:600]
+            return f"[{label} - NOT FOUND]"
 
         status, count = _parse_lec_lab_status(all_lec_lab_rows)
 
         if status == "closed":
-            return f"[{label} - CLOSED]", matching_blocks[0][:600]
+            return f"[{label} - CLOSED]"
         if status == "open" and count is not None:
-            return f"[{label} - {count} SEATS OPEN]", matching_blocks[0][:600]
+            return f"[{label} - {count} SEATS OPEN]"
         if status == "waitlist" and count is not None:
-            return f"[{label} - {count} WAITLIST SEATS]", matching_blocks[0][:600]
-        return f"[{label} - CLOSED]", matching_blocks[0][:600]
+            return f"[{label} - {count} WAITLIST SEATS]"
+        return f"[{label} - CLOSED]"
     except Exception as e:
         logger.warning("Extract availability failed for %s: %s", label, e)
-        return f"[{label} - ERROR]", str(e)
+        return f"[{label} - ERROR]"
 
 
 def _parse_args() -> argparse.Namespace:
@@ -195,11 +421,46 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument("--no-sound", action="store_true",
                         default=os.environ.get("UCLA_MONITOR_SOUND", "1").lower() in ("0", "false", "no"),
                         help="Disable sound notifications")
+    parser.add_argument("--interactive", action="store_true",
+                        default=os.environ.get("UCLA_MONITOR_INTERACTIVE", "").lower() in ("1", "true", "yes"),
+                        help="Wait for Enter after login instead of detecting the enrollment page")
+    parser.add_argument("--http", action="store_true",
+                        default=os.environ.get("UCLA_MONITOR_HTTP", "").lower() in ("1", "true", "yes"),
+                        help="After login, poll the page over HTTP with the browser's cookies instead of refreshing Chrome")
+    parser.add_argument("--profile-dir", default=os.environ.get("UCLA_MONITOR_PROFILE_DIR"),
+                        help="Chrome user data dir to reuse across runs (keeps login cookies)")
+    parser.add_argument("--debugger-address", default=os.environ.get("UCLA_MONITOR_DEBUGGER_ADDRESS"),
+                        help="Attach to a Chrome started with --remote-debugging-port (e.g. localhost:9222)")
     parser.add_argument("--channel", default=os.environ.get("SLACK_CHANNEL"),
                         help="Slack channel to post to (overrides SLACK_CHANNEL env var)")
     return parser.parse_args()
 
 
+def _chrome_options(args: argparse.Namespace) -> Options:
+    """Chrome options for a text-only scrape: no images or notifications, no extensions or background traffic."""
+    opts = Options()
+    if args.debugger_address:
+        # Attach to an already-running Chrome; launch flags don't apply to a browser we didn't start
+        if args.headless or args.profile_dir:
+            logger.warning("--headless and --profile-dir have no effect with --debugger-address; "
+                           "pass --headless=new / --user-data-dir when launching that Chrome instead")
+        opts.add_experimental_option("debuggerAddress", args.debugger_address)
+        return opts
+    if args.headless:
+        opts.add_argument("--headless=new")
+    opts.add_argument("--blink-settings=imagesEnabled=false")
+    opts.add_argument("--disable-extensions")
+    opts.add_argument("--disable-background-networking")
+    opts.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    if args.profile_dir:
+        # Persistent profile keeps the MyUCLA cookies across runs, so restarts may skip login
+        opts.add_argument(f"--user-data-dir={args.profile_dir}")
+    return opts
+
+
 def main() -> None:
     args = _parse_args()
 
@@ -207,73 +468,125 @@ def main() -> None:
         logger.error("SLACK_CHANNEL required (set in .env or pass --channel)")
         return
 
-    opts = Options()
-    if args.headless:
-        opts.add_argument("--headless=new")
-    driver = webdriver.Chrome(options=opts)
+    driver = webdriver.Chrome(options=_chrome_options(args))
     slack = SlackBotClient.from_env()
 
     # Track last known status per course to avoid spamming Slack on every refresh
     last_status: dict[str, str] = {}
+    # Last available status per course that already triggered the sound alert
+    beeped: dict[str, str] = {}
+    # Hash of the last parsed page — identical refreshes can't change any course status
+    last_page_hash: int | None = None
+
+    # Single worker: refreshes run one at a time, in the background of parsing and posting
+    executor = ThreadPoolExecutor(max_workers=1)
+    stop = threading.Event()
+    http: requests.Session | None = None
 
     try:
         logger.info("Opening UCLA enrollment page...")
         driver.get(UCLA_ENROLLMENT_URL)
 
-        input("Press Enter after you've logged in and the enrollment page is visible...")
+        try:
+            _wait_for_login(driver, args.interactive, "Press Enter after you've logged in and the enrollment page is visible...")
+        except TimeoutException:
+            logger.error("Login not detected within %ds", LOGIN_TIMEOUT)
+            return
 
         logger.info("Starting monitor loop (refresh every %ds, courses=%s)", args.interval, [f"{c[0]}({c[1]})" for c in COURSES])
 
+        if args.http:
+            # Chrome is only needed for login; poll with plain HTTP requests on its cookies
+            http = requests.Session()
+            _sync_cookies(driver, http)
+            fetch = functools.partial(_fetch_page_http, http, args.interval, stop)
+        else:
+            fetch = functools.partial(_fetch_page, driver, args.interval, stop)
+
+        future = executor.submit(fetch)
         while True:
-            time.sleep(args.interval)
-            driver.refresh()
-
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-            except Exception as e:
-                logger.warning("Wait for page failed: %s", e)
+            page = future.result()
+            if page is not None and _is_session_expired(*page):
+                _wait_for_relogin(driver, args.interactive)
+                if http is not None:
+                    _sync_cookies(driver, http)
+                page = None
+
+            # Start the next refresh now so it overlaps with parsing and Slack posts below
+            future = executor.submit(fetch)
+            if page is None:
                 continue
+            _, page_text = page
 
-            if _is_session_expired(driver):
-                _wait_for_relogin(driver)
+            page_hash = hash(page_text)
+            if page_hash == last_page_hash:
+                logger.debug("Page unchanged since last refresh; skipping parse")
                 continue
+            last_page_hash = page_hash
+
+            # Notices for every course that changed this refresh, sent as one Slack message
+            msgs: list[str] = []
+            pending: dict[str, str] = {}
+            any_opened = False
 
             for label, class_code in COURSES:
-                status, _ = get_course_availability(driver, label, class_code)
+                status = get_course_availability(page_text, label, class_code)
                 logger.info(status)
 
                 prev = last_status.get(label)
                 if status == prev:
                     continue  # no change — skip Slack and sound
 
-                last_status[label] = status
-
                 is_available = "CLOSED" not in status and "NOT FOUND" not in status and "ERROR" not in status
                 was_available = prev and "CLOSED" not in prev and "NOT FOUND" not in prev and "ERROR" not in prev
 
                 # Notify when opening (any -> available) or closing (available -> closed)
                 if is_available:
-                    msg = f"*{status}*"
-                    logger.info("Posting %s to %s", status, args.channel)
-                    slack.post(msg)
-                    if winsound and not args.no_sound:
-                        try:
-                            for _ in range(3):
-                                winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
-                                time.sleep(0.2)
-                        except Exception:
-                            pass
-                elif was_available and "CLOSED" in status:
-                    msg = f"~{label} is now closed~"
-                    logger.info("Posting closure notice for %s to %s", label, args.channel)
-                    slack.post(msg)
+                    msgs.append(f"*{status}*")
+                    pending[label] = status
+                    # Beep once per opening, even if the Slack post fails and is retried on later refreshes
+                    if beeped.get(label) != status:
+                        beeped[label] = status
+                        any_opened = True
+                else:
+                    # No longer available, so the next opening (even at the same seat count) beeps again
+                    beeped.pop(label, None)
+                    if was_available and "CLOSED" in status:
+                        msgs.append(f"~{label} is now closed~")
+                        pending[label] = status
+                    else:
+                        last_status[label] = status
+
+            if msgs:
+                logger.info("Posting %d update(s) to %s", len(msgs), args.channel)
+                # Only remember statuses once their notice went out, so a failed post is retried next refresh
+                if slack.post("\n".join(msgs)):
+                    last_status.update(pending)
+                elif slack.last_error_permanent:
+                    # Retrying can't fix bad config/credentials; drop these notices instead of re-posting every refresh
+                    logger.error("Slack rejected the post (%s); giving up on %d update(s) — check SLACK_* settings",
+                                 slack.last_error, len(msgs))
+                    last_status.update(pending)
+                else:
+                    last_page_hash = None
+
+            if any_opened and winsound and not args.no_sound:
+                try:
+                    for _ in range(3):
+                        winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
+                        time.sleep(0.2)
+                except Exception:
+                    pass
 
     except KeyboardInterrupt:
         logger.info("Stopped by user")
     finally:
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
         driver.quit()
+        if http is not None:
+            http.close()
+        slack.close()
 
 
 if __name__ == "__main__":
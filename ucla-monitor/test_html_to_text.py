@@ -0,0 +1,57 @@
+"""Tests for _html_to_text, the innerText approximation used by --http mode."""
+
+import unittest
+
+from monitor import _html_to_text, get_course_availability
+
+
+class HtmlToTextTest(unittest.TestCase):
+    def test_table_row_cells_share_a_line(self):
+        html = "<table><tr><td>Lec 1</td><td>MW</td><td>Open: 3 of 10 left</td></tr></table>"
+        self.assertEqual(_html_to_text(html), "Lec 1\tMW\tOpen: 3 of 10 left")
+
+    def test_block_tags_and_br_break_lines(self):
+        self.assertEqual(_html_to_text("<div>a</div><p>b</p>c<br>d<br/>e"), "a\nb\nc\nd\ne")
+
+    def test_whitespace_collapsed_and_blank_lines_dropped(self):
+        self.assertEqual(_html_to_text("<div>  Class\n  1: </div><div> </div><div>x&nbsp;y</div>"), "Class 1:\nx y")
+
+    def test_non_rendered_content_dropped(self):
+        html = (
+            "<html><head><title>Sign in</title><style>p{}</style></head><body>"
+            "<script>var a = 1;</script><select><option>Class 9:</option></select>"
+            "<div>shown</div></body></html>"
+        )
+        self.assertEqual(_html_to_text(html), "shown")
+
+    def test_hidden_elements_dropped(self):
+        html = (
+            '<div style="display: none"><div>Username</div><div>Password</div></div>'
+            '<span style="visibility:hidden">Log in</span><p hidden>Sign in</p>'
+            '<input type="hidden" value="x"><div>after</div>'
+        )
+        self.assertEqual(_html_to_text(html), "after")
+
+    def test_hidden_element_closed_implicitly_by_sibling(self):
+        self.assertEqual(_html_to_text("<p hidden>x<p>Class 1:<p>4w - W"), "Class 1:\n4w - W")
+        self.assertEqual(_html_to_text("<ul><li hidden>x<li>Class 1:</ul><p>after"), "Class 1:\nafter")
+        self.assertEqual(_html_to_text("<table><tr hidden><td>a<tr><td>b</table>"), "b")
+
+    def test_hidden_element_closed_implicitly_by_parent_end(self):
+        self.assertEqual(_html_to_text("<ul><li hidden>x</ul><p>after"), "after")
+
+    def test_nested_list_inside_hidden_item_stays_hidden(self):
+        html = "<ul><li hidden>a<ul><li>b</li></ul>c<li>shown</ul>"
+        self.assertEqual(_html_to_text(html), "shown")
+
+    def test_feeds_course_parser(self):
+        html = (
+            "<div>Class 1:</div><div>4W - Writing</div><table>"
+            "<tr><td>Lec 1</td><td>MW</td><td>Open: 3 of 10 left</td></tr>"
+            "<tr><td>Dis 1A</td><td>F</td><td>Closed</td></tr></table>"
+        )
+        self.assertEqual(get_course_availability(_html_to_text(html), "Eng", "4W"), "[Eng - 3 SEATS OPEN]")
+
+
+if __name__ == "__main__":
+    unittest.main()